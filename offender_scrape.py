@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""Unified command line for the Idaho SOR scraper.
+
+Heavy dependencies (requests/bs4 for scraping, reportlab/PIL for PDFs) are
+imported only inside the subcommands that need them, so lightweight commands
+like query and diff start quickly.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+DEFAULT_COUNTY = 'BONNER'
+
+class DataFileError(Exception):
+    """A scraped JSON file could not be read"""
+
+
+# Fields compared by the diff command (offenses are compared separately)
+DIFF_FIELDS = ['name', 'address', 'city', 'county', 'zip', 'status']
+
+
+def non_negative_float(value):
+    """argparse type for delays"""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative: {value}")
+    return number
+
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value}")
+    return number
+
+
+def county_json_file(county):
+    """Return the JSON file written by the scraper for a county"""
+    return f'{county.lower()}_county_offenders.json'
+
+
+def load_offenders(path):
+    """Load offender records from a JSON file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        offenders = json.load(f)
+
+    if not isinstance(offenders, list) or not all(isinstance(o, dict) for o in offenders):
+        raise ValueError(f"{path}: expected a JSON list of offender records")
+    return offenders
+
+
+def index_by_kno(offenders, path):
+    """Map KNO to record, warning about records that cannot be matched reliably"""
+    index = {}
+    empty = 0
+    for offender in offenders:
+        kno = offender.get('kno') or ''
+        if not kno:
+            empty += 1
+            continue
+        if kno in index:
+            print(f"Warning: {path}: duplicate KNO {kno}, keeping the last record", file=sys.stderr)
+        index[kno] = offender
+
+    if empty:
+        print(f"Warning: {path}: skipping {empty} record(s) with no KNO", file=sys.stderr)
+    return index
+
+
+def offense_set(offender):
+    """Return an offender's offenses as a set of comparable tuples"""
+    return {
+        (o.get('offense', ''), o.get('description', ''), o.get('date', ''), o.get('location', ''))
+        for o in offender.get('offenses') or []
+        if isinstance(o, dict)
+    }
+
+
+def resolve_data_file(value):
+    """Accept either a JSON file path or a county name"""
+    if os.path.exists(value) or value.lower().endswith('.json'):
+        return value
+    return county_json_file(value)
+
+
+def read_data_file(value):
+    """Resolve and load a JSON file or county name, raising DataFileError on failure"""
+    path = resolve_data_file(value)
+    try:
+        return path, load_offenders(path)
+    except FileNotFoundError:
+        raise DataFileError(f"{path} not found")
+    except (OSError, ValueError) as e:
+        # ValueError also covers json.JSONDecodeError
+        raise DataFileError(f"{path}: {e}")
+
+
+def missing_dependency(command, error):
+    """Report a heavy dependency that is not installed"""
+    print(f"Error: the {command} command needs the '{error.name}' package; "
+          f"install the dependencies with: pip install -r requirements.txt", file=sys.stderr)
+    return 1
+
+
+def cmd_scrape(args):
+    """Scrape offender data for a county"""
+    try:
+        from scraper import IdahoSORScraper
+    except ImportError as e:
+        return missing_dependency('scrape', e)
+
+    scraper = IdahoSORScraper(
+        county=args.county,
+        workers=args.workers,
+        page_delay=args.page_delay,
+        request_delay=args.request_delay
+    )
+    scraper.scrape_all()
+    return 0
+
+
+def cmd_pdf(args):
+    """Generate the PDF report for a county"""
+    try:
+        from generate_pdf import OffenderPDFGenerator
+    except ImportError as e:
+        return missing_dependency('pdf', e)
+
+    generator = OffenderPDFGenerator(county=args.county)
+    generator.create_photo_grid()
+    return 0
+
+
+def cmd_diff(args):
+    """Compare two scrapes and report added, removed and changed offenders"""
+    old_file, old_offenders = read_data_file(args.old)
+    new_file, new_offenders = read_data_file(args.new)
+    old = index_by_kno(old_offenders, old_file)
+    new = index_by_kno(new_offenders, new_file)
+
+    added = [kno for kno in new if kno not in old]
+    removed = [kno for kno in old if kno not in new]
+    changed = []
+    for kno in new:
+        if kno not in old:
+            continue
+        fields = [f for f in DIFF_FIELDS if old[kno].get(f, '') != new[kno].get(f, '')]
+        new_offenses = offense_set(new[kno]) - offense_set(old[kno])
+        dropped_offenses = offense_set(old[kno]) - offense_set(new[kno])
+        if fields or new_offenses or dropped_offenses:
+            changed.append((kno, fields, new_offenses, dropped_offenses))
+
+    for kno in added:
+        print(f"+ {kno} {new[kno].get('name', '')}")
+    for kno in removed:
+        print(f"- {kno} {old[kno].get('name', '')}")
+    for kno, fields, new_offenses, dropped_offenses in changed:
+        print(f"~ {kno} {new[kno].get('name', '')}")
+        for field in fields:
+            print(f"    {field}: {old[kno].get(field, '')} -> {new[kno].get(field, '')}")
+        for offense in sorted(new_offenses):
+            print(f"    offense added: {offense[0]} {offense[1]} ({offense[2]})")
+        for offense in sorted(dropped_offenses):
+            print(f"    offense removed: {offense[0]} {offense[1]} ({offense[2]})")
+
+    print(f"\nAdded: {len(added)}, Removed: {len(removed)}, Changed: {len(changed)}")
+
+    # Like diff(1), exit 1 when the inputs differ so scripts can branch on it
+    return 1 if (added or removed or changed) else 0
+
+
+def cmd_query(args):
+    """Filter offenders from a scraped JSON file"""
+    _, offenders = read_data_file(args.source)
+
+    matches = []
+    for offender in offenders:
+        if args.name and args.name.upper() not in (offender.get('name') or '').upper():
+            continue
+        if args.city and args.city.upper() != (offender.get('city') or '').upper():
+            continue
+        if args.status and args.status.upper() not in (offender.get('status') or '').upper():
+            continue
+        if args.kno and args.kno != offender.get('kno', ''):
+            continue
+        matches.append(offender)
+
+    if args.json:
+        json.dump(matches, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    elif args.count:
+        print(len(matches))
+    else:
+        for offender in matches:
+            print(f"{offender.get('kno', '')}\t{offender.get('name', '')}\t"
+                  f"{offender.get('address', '')}, {offender.get('city', '')}\t{offender.get('status', '')}")
+    return 0
+
+
+def cmd_bench(args):
+    """Time interpreter startup for the CLI and each heavy module"""
+    import subprocess
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    targets = [
+        ('cli', [sys.executable, os.path.abspath(__file__), '--help']),
+        ('scraper', [sys.executable, '-c', 'import scraper']),
+        ('generate_pdf', [sys.executable, '-c', 'import generate_pdf']),
+    ]
+
+    print(f"Startup time over {args.repeat} run(s):")
+    for label, command in targets:
+        timings = []
+        failed = False
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = subprocess.run(command, cwd=here, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            timings.append((time.perf_counter() - start) * 1000)
+            if result.returncode != 0:
+                failed = True
+                break
+        if failed:
+            print(f"  {label:<14} failed (missing dependencies?)")
+            continue
+        print(f"  {label:<14} min {min(timings):7.1f} ms   mean {sum(timings) / len(timings):7.1f} ms")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description='Scrape, report on and query the Idaho Sex Offender Registry.'
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+    subparsers.required = True
+
+    # scrape
+    scrape = subparsers.add_parser('scrape', help='scrape offender data for a county')
+    scrape.add_argument('county', nargs='?', default=DEFAULT_COUNTY, type=str.upper,
+                        help=f'county name (default: {DEFAULT_COUNTY})')
+    scrape.add_argument('-w', '--workers', type=positive_int, default=1,
+                        help='concurrent detail/image fetches per page (default: 1)')
+    scrape.add_argument('--page-delay', type=non_negative_float, default=1.0,
+                        help='seconds to wait between result pages (default: 1.0)')
+    scrape.add_argument('--request-delay', type=non_negative_float, default=0.5,
+                        help='minimum seconds between detail/image requests, shared by all workers (default: 0.5)')
+    scrape.set_defaults(func=cmd_scrape)
+
+    # pdf
+    pdf = subparsers.add_parser('pdf', help='generate a PDF report for a county')
+    pdf.add_argument('county', nargs='?', default=DEFAULT_COUNTY, type=str.upper,
+                     help=f'county name (default: {DEFAULT_COUNTY})')
+    pdf.set_defaults(func=cmd_pdf)
+
+    # diff
+    diff = subparsers.add_parser('diff', help='compare two scraped JSON files')
+    diff.add_argument('old', help='older JSON file or county name')
+    diff.add_argument('new', help='newer JSON file or county name')
+    diff.set_defaults(func=cmd_diff)
+
+    # query
+    query = subparsers.add_parser('query', help='filter offenders in a scraped JSON file')
+    query.add_argument('source', nargs='?', default=DEFAULT_COUNTY,
+                       help=f'JSON file or county name (default: {DEFAULT_COUNTY})')
+    query.add_argument('--name', help='match names containing this text')
+    query.add_argument('--city', help='match this city exactly')
+    query.add_argument('--status', help='match statuses containing this text (e.g. "NON COMP")')
+    query.add_argument('--kno', help='match this KNO number')
+    output = query.add_mutually_exclusive_group()
+    output.add_argument('--json', action='store_true', help='print matches as JSON')
+    output.add_argument('--count', action='store_true', help='print only the number of matches')
+    query.set_defaults(func=cmd_query)
+
+    # bench
+    bench = subparsers.add_parser('bench', help='measure startup time of the CLI and heavy modules')
+    bench.add_argument('-n', '--repeat', type=positive_int, default=5,
+                       help='number of runs per target (default: 5)')
+    bench.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        return args.func(args)
+    except DataFileError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,17 +4,28 @@ import json
 import os
 import re
 from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import time
 import sys
 
 class IdahoSORScraper:
-    def __init__(self, county='BONNER'):
+    def __init__(self, county='BONNER', workers=1, page_delay=1.0, request_delay=0.5):
         self.base_url = "https://apps.isp.idaho.gov/sor_id/"
         self.county = county.upper()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        
+        # Concurrency and rate limiting
+        self.workers = max(1, workers)
+        self.page_delay = page_delay
+        self.request_delay = request_delay
+        self._rate_lock = threading.Lock()
+        self._last_request = 0.0
+        
+        # requests.Session is not documented as thread-safe, so each worker thread gets its own
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+        self._executor = None
         self.offenders_data = []
         
         # County-specific directories and files
@@ -26,6 +37,46 @@ class IdahoSORScraper:
         print(f"Scraping {self.county} County")
         print(f"Images will be saved to: {self.images_dir}")
         print(f"Data will be saved to: {self.output_file}")
+        print(f"Workers: {self.workers}, page delay: {self.page_delay}s, request delay: {self.request_delay}s")
+
+    def get_session(self):
+        """Return the HTTP session for the current thread"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            })
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def get_executor(self):
+        """Return the worker pool, created on first use and reused across pages"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def close(self):
+        """Shut down the worker pool and close every thread's HTTP session"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions = []
+        self._local = threading.local()
+
+    def wait_for_rate_limit(self):
+        """Space detail and image requests at least request_delay apart across all workers"""
+        with self._rate_lock:
+            wait = self._last_request + self.request_delay - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request = time.monotonic()
 
     def make_post_request(self, page=None):
         """Make POST request to the SOR page"""
@@ -40,18 +91,19 @@ class IdahoSORScraper:
             data['page'] = str(page)
             data['srt'] = '1'
         
-        response = self.session.post(url, data=data)
+        response = self.get_session().post(url, data=data)
         response.raise_for_status()
         return response.text
 
     def download_image(self, img_url, offender_name, kno):
         """Download image and return local filename"""
+        self.wait_for_rate_limit()  # Be respectful to the server
         try:
             # Remove /thumbs/ from the URL
             full_img_url = img_url.replace('/thumbs/', '/')
             full_img_url = urljoin(self.base_url, full_img_url)
             
-            response = self.session.get(full_img_url, timeout=10)
+            response = self.get_session().get(full_img_url, timeout=10)
             response.raise_for_status()
             
             # Create filename from KNO and name
@@ -70,9 +122,10 @@ class IdahoSORScraper:
 
     def get_offender_details(self, offender_url):
         """Scrape detailed information from offender's page"""
+        self.wait_for_rate_limit()  # Be respectful to the server
         try:
             full_url = urljoin(self.base_url, offender_url)
-            response = self.session.get(full_url, timeout=10)
+            response = self.get_session().get(full_url, timeout=10)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
             
@@ -165,7 +218,6 @@ class IdahoSORScraper:
                             if label not in details['identification']:
                                 details['identification'][label] = value
             
-            time.sleep(0.5)  # Be respectful to the server
             return details
             
         except Exception as e:
@@ -183,7 +235,7 @@ class IdahoSORScraper:
             print("Table not found")
             return []
         
-        offenders = []
+        rows_data = []
         rows = table.find_all('tr')
         
         for row in rows:
@@ -222,16 +274,7 @@ class IdahoSORScraper:
                 img_tag = img_cell.find('img') if img_cell else None
                 img_url = img_tag.get('src') if img_tag else None
                 
-                # Download image
-                image_path = None
-                if img_url:
-                    image_path = self.download_image(img_url, name, kno)
-                
-                # Get detailed information from offender page
-                print(f"Fetching details for {name}...")
-                details = self.get_offender_details(offender_url) if offender_url else {}
-                
-                offender_data = {
+                rows_data.append({
                     'name': name,
                     'kno': kno,
                     'address': address,
@@ -239,15 +282,9 @@ class IdahoSORScraper:
                     'county': county,
                     'zip': zip_code,
                     'status': status,
-                    'profile_url': urljoin(self.base_url, offender_url) if offender_url else '',
-                    'image_url': urljoin(self.base_url, img_url.replace('/thumbs/', '/')) if img_url else '',
-                    'local_image_path': image_path,
-                    'identification': details.get('identification', {}),
-                    'offenses': details.get('offenses', [])
-                }
-                
-                offenders.append(offender_data)
-                print(f"Processed: {name} - Found {len(details.get('offenses', []))} offense(s)")
+                    'offender_url': offender_url,
+                    'img_url': img_url
+                })
                 
             except Exception as e:
                 print(f"Error parsing row: {e}")
@@ -255,7 +292,65 @@ class IdahoSORScraper:
                 traceback.print_exc()
                 continue
         
-        return offenders
+        # Fetch images and detail pages, in parallel when more than one worker is configured
+        if self.workers > 1:
+            executor = self.get_executor()
+            try:
+                results = list(executor.map(self.process_offender, rows_data))
+            except BaseException:
+                # On Ctrl-C, drop the queued rows instead of fetching the rest of the page
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+                raise
+        else:
+            results = [self.process_offender(row_data) for row_data in rows_data]
+        
+        # Rows that failed to process are skipped
+        return [offender for offender in results if offender is not None]
+
+    def process_offender(self, row_data):
+        """Download image and details for a parsed table row, or None on error"""
+        try:
+            return self.build_offender(row_data)
+        except Exception as e:
+            print(f"Error processing {row_data.get('name', '')}: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+
+    def build_offender(self, row_data):
+        """Download image and details for a parsed table row"""
+        name = row_data['name']
+        kno = row_data['kno']
+        offender_url = row_data['offender_url']
+        img_url = row_data['img_url']
+        
+        # Download image
+        image_path = None
+        if img_url:
+            image_path = self.download_image(img_url, name, kno)
+        
+        # Get detailed information from offender page
+        print(f"Fetching details for {name}...")
+        details = self.get_offender_details(offender_url) if offender_url else {}
+        
+        offender_data = {
+            'name': name,
+            'kno': kno,
+            'address': row_data['address'],
+            'city': row_data['city'],
+            'county': row_data['county'],
+            'zip': row_data['zip'],
+            'status': row_data['status'],
+            'profile_url': urljoin(self.base_url, offender_url) if offender_url else '',
+            'image_url': urljoin(self.base_url, img_url.replace('/thumbs/', '/')) if img_url else '',
+            'local_image_path': image_path,
+            'identification': details.get('identification', {}),
+            'offenses': details.get('offenses', [])
+        }
+        
+        print(f"Processed: {name} - Found {len(details.get('offenses', []))} offense(s)")
+        return offender_data
 
     def get_next_pages(self, html):
         """Extract pagination links"""
@@ -280,6 +375,22 @@ class IdahoSORScraper:
 
     def scrape_all(self):
         """Main scraping function"""
+        try:
+            self.scrape_pages()
+        finally:
+            self.close()
+        
+        # Save to JSON
+        with open(self.output_file, 'w', encoding='utf-8') as f:
+            json.dump(self.offenders_data, f, indent=2, ensure_ascii=False)
+        
+        print(f"\n\nScraping complete!")
+        print(f"Total offenders: {len(self.offenders_data)}")
+        print(f"Data saved to: {self.output_file}")
+        print(f"Images saved to: {self.images_dir}/")
+
+    def scrape_pages(self):
+        """Fetch and parse every results page"""
         print(f"\nStarting scrape for {self.county} County...")
         
         # Get first page
@@ -299,18 +410,10 @@ class IdahoSORScraper:
             try:
                 html = self.make_post_request(page=page_num)
                 self.offenders_data.extend(self.parse_table(html))
-                time.sleep(1)  # Be respectful to the server
             except Exception as e:
                 print(f"Error fetching page {page_num}: {e}")
-        
-        # Save to JSON
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            json.dump(self.offenders_data, f, indent=2, ensure_ascii=False)
-        
-        print(f"\n\nScraping complete!")
-        print(f"Total offenders: {len(self.offenders_data)}")
-        print(f"Data saved to: {self.output_file}")
-        print(f"Images saved to: {self.images_dir}/")
+            
+            time.sleep(self.page_delay)  # Be respectful to the server
 
 def main():
     # Default to BONNER county, but allow command-line parameter
@@ -0,0 +1,183 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import offender_scrape
+
+
+def write_json(path, data):
+    path.write_text(json.dumps(data), encoding='utf-8')
+    return str(path)
+
+
+def offender(kno, name, city='SANDPOINT', status='COMPLIANT', address='1 MAIN ST', offenses=None):
+    return {
+        'kno': kno,
+        'name': name,
+        'address': address,
+        'city': city,
+        'county': 'BONNER',
+        'zip': '83864',
+        'status': status,
+        'offenses': offenses or [],
+    }
+
+
+LEWD = {'offense': '18-1508', 'description': 'LEWD CONDUCT', 'date': '03/15/2015', 'location': 'BONNER'}
+BATTERY = {'offense': '18-1506', 'description': 'SEXUAL BATTERY', 'date': '01/02/2024', 'location': 'ADA'}
+
+
+@pytest.fixture
+def county_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return write_json(tmp_path / 'bonner_county_offenders.json', [
+        offender('1', 'DOE, JOHN'),
+        offender('2', 'SMITH, JAMES', city='PRIEST RIVER', status='NON COMP'),
+        offender('3', 'DOE, JANE', city='Sandpoint'),
+    ])
+
+
+def test_resolve_data_file_county_name(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert offender_scrape.resolve_data_file('KOOTENAI') == 'kootenai_county_offenders.json'
+
+
+def test_resolve_data_file_paths(county_file):
+    assert offender_scrape.resolve_data_file(county_file) == county_file
+    assert offender_scrape.resolve_data_file('missing.json') == 'missing.json'
+
+
+def test_query_filters(county_file, capsys):
+    assert offender_scrape.main(['query', 'BONNER', '--city', 'sandpoint', '--count']) == 0
+    assert capsys.readouterr().out.strip() == '2'
+
+    assert offender_scrape.main(['query', county_file, '--name', 'doe', '--status', 'compliant', '--json']) == 0
+    matches = json.loads(capsys.readouterr().out)
+    assert [o['kno'] for o in matches] == ['1', '3']
+
+    assert offender_scrape.main(['query', '--status', 'non comp']) == 0
+    assert capsys.readouterr().out.startswith('2\tSMITH, JAMES')
+
+    assert offender_scrape.main(['query', '--kno', '3', '--count']) == 0
+    assert capsys.readouterr().out.strip() == '1'
+
+
+def test_diff_identical(tmp_path, capsys):
+    data = [offender('1', 'DOE, JOHN', offenses=[LEWD])]
+    old = write_json(tmp_path / 'old.json', data)
+    new = write_json(tmp_path / 'new.json', data)
+
+    assert offender_scrape.main(['diff', old, new]) == 0
+    assert 'Added: 0, Removed: 0, Changed: 0' in capsys.readouterr().out
+
+
+def test_diff_added_removed_changed(tmp_path, capsys):
+    old = write_json(tmp_path / 'old.json', [
+        offender('1', 'DOE, JOHN'),
+        offender('2', 'SMITH, JAMES', address='2 ELM ST', offenses=[LEWD]),
+    ])
+    new = write_json(tmp_path / 'new.json', [
+        offender('2', 'SMITH, JAMES', address='9 OAK ST', offenses=[LEWD]),
+        offender('3', 'DOE, JANE'),
+    ])
+
+    assert offender_scrape.main(['diff', old, new]) == 1
+    out = capsys.readouterr().out
+    assert '+ 3 DOE, JANE' in out
+    assert '- 1 DOE, JOHN' in out
+    assert 'address: 2 ELM ST -> 9 OAK ST' in out
+    assert 'Added: 1, Removed: 1, Changed: 1' in out
+
+
+def test_diff_detects_new_offense(tmp_path, capsys):
+    old = write_json(tmp_path / 'old.json', [offender('1', 'DOE, JOHN', offenses=[LEWD])])
+    new = write_json(tmp_path / 'new.json', [offender('1', 'DOE, JOHN', offenses=[LEWD, BATTERY])])
+
+    assert offender_scrape.main(['diff', old, new]) == 1
+    out = capsys.readouterr().out
+    assert 'offense added: 18-1506 SEXUAL BATTERY' in out
+    assert 'Changed: 1' in out
+
+
+def test_diff_warns_on_duplicate_and_empty_kno(tmp_path, capsys):
+    old = write_json(tmp_path / 'old.json', [
+        offender('1', 'DOE, JOHN'),
+        offender('1', 'DOE, JOHN'),
+        offender('', 'NO KNO'),
+    ])
+    new = write_json(tmp_path / 'new.json', [offender('1', 'DOE, JOHN')])
+
+    assert offender_scrape.main(['diff', old, new]) == 0
+    err = capsys.readouterr().err
+    assert 'duplicate KNO 1' in err
+    assert 'skipping 1 record(s) with no KNO' in err
+
+
+@pytest.mark.parametrize('contents', ['"not a list"', '["not a record"]', '{"kno": "1"}', '[{"kno": '])
+def test_bad_json_exits_cleanly(tmp_path, capsys, contents):
+    path = tmp_path / 'bad.json'
+    path.write_text(contents, encoding='utf-8')
+
+    assert offender_scrape.main(['query', str(path)]) == 2
+    assert capsys.readouterr().err.startswith('Error: ')
+
+
+def test_missing_file_and_directory_exit_cleanly(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    assert offender_scrape.main(['query', 'NOWHERE']) == 2
+    assert 'nowhere_county_offenders.json not found' in capsys.readouterr().err
+
+    assert offender_scrape.main(['query', '.']) == 2
+    assert capsys.readouterr().err.startswith('Error: ')
+
+
+@pytest.mark.parametrize('argv', [
+    ['scrape', '--page-delay', '-1'],
+    ['scrape', '--request-delay', '-0.5'],
+    ['scrape', '--request-delay', 'fast'],
+    ['scrape', '--workers', '0'],
+    ['bench', '-n', '0'],
+    ['bench', '--repeat', '-3'],
+])
+def test_invalid_arguments_rejected(argv):
+    with pytest.raises(SystemExit) as exc:
+        offender_scrape.build_parser().parse_args(argv)
+    assert exc.value.code == 2
+
+
+def test_valid_scrape_arguments():
+    args = offender_scrape.build_parser().parse_args(
+        ['scrape', 'kootenai', '--workers', '4', '--page-delay', '0', '--request-delay', '1.5'])
+    assert args.county == 'KOOTENAI'
+    assert args.workers == 4
+    assert args.page_delay == 0.0
+    assert args.request_delay == 1.5
+
+
+def test_lightweight_commands_skip_heavy_imports(county_file):
+    # Run in a fresh interpreter so modules imported by other tests don't leak in
+    script = (
+        "import sys, offender_scrape\n"
+        "offender_scrape.main(['query', 'BONNER', '--count'])\n"
+        "offender_scrape.main(['diff', 'BONNER', 'BONNER'])\n"
+        "heavy = ['scraper', 'generate_pdf', 'requests', 'bs4', 'reportlab', 'PIL']\n"
+        "print('LOADED', [m for m in heavy if m in sys.modules])\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.abspath(offender_scrape.__file__)))
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, env=env)
+
+    assert result.returncode == 0, result.stderr
+    assert 'LOADED []' in result.stdout
+
+
+def test_missing_dependency_message(monkeypatch, capsys):
+    # A None entry in sys.modules makes the import fail as if the package were absent
+    monkeypatch.setitem(sys.modules, 'generate_pdf', None)
+
+    assert offender_scrape.main(['pdf', 'BONNER']) == 1
+    err = capsys.readouterr().err
+    assert "needs the 'generate_pdf' package" in err
+    assert 'pip install -r requirements.txt' in err
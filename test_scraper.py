@@ -0,0 +1,177 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip('requests')
+pytest.importorskip('bs4')
+
+import scraper
+
+
+DETAIL_HTML = """
+<table>
+  <tr><td>Reg ID:</td><td>SX1</td></tr>
+  <tr><td colspan="4">Offenses Requiring Registration</td></tr>
+  <tr><th>Offense</th><th>Description</th><th>Date</th><th>Place of Conviction</th></tr>
+  <tr><td>18-1508</td><td>LEWD CONDUCT</td><td>03/15/2015</td><td>BONNER</td></tr>
+</table>
+"""
+
+
+def results_page(count):
+    rows = ''.join(
+        f'<tr><td id="off_img"><img src="/sorFiles/photos/thumbs/{i}.jpg"></td>'
+        f'<td id="nam_field"><a href="SOR?id={i}">OFFENDER {i}</a></td>'
+        f'<td id="kno_field">{i}</td><td id="adr_field">{i} MAIN ST</td>'
+        f'<td id="cty_field">SANDPOINT</td><td id="cty_field">BONNER</td>'
+        f'<td id="zip_field">83864</td><td id="stat_field">COMPLIANT</td></tr>'
+        for i in range(count)
+    )
+    return f'<table id="data_tbl"><tr><th>Name</th></tr>{rows}</table>'
+
+
+class FakeResponse:
+    def __init__(self, url):
+        self.text = DETAIL_HTML
+        self.content = url.encode()
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Stands in for requests.Session; records which thread used it"""
+    instances = []
+    lock = threading.Lock()
+    delay = 0.0
+
+    def __init__(self):
+        self.headers = {}
+        self.closed = False
+        self.threads = set()
+        with FakeSession.lock:
+            FakeSession.instances.append(self)
+
+    def get(self, url, timeout=None):
+        self.threads.add(threading.get_ident())
+        if FakeSession.delay:
+            time.sleep(FakeSession.delay)
+        return FakeResponse(url)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClock:
+    """Replaces the time module inside scraper; sleep advances the clock instantly"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def monotonic(self):
+        with self.lock:
+            self.calls.append(self.now)
+            return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.now += seconds
+
+
+@pytest.fixture
+def make_scraper(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(scraper.requests, 'Session', FakeSession)
+    monkeypatch.setattr(FakeSession, 'instances', [])
+    monkeypatch.setattr(FakeSession, 'delay', 0.0)
+    created = []
+
+    def factory(workers=4, request_delay=0.0):
+        instance = scraper.IdahoSORScraper('TEST', workers=workers, page_delay=0, request_delay=request_delay)
+        created.append(instance)
+        return instance
+
+    yield factory
+    for instance in created:
+        instance.close()
+
+
+def test_parallel_results_keep_row_order(make_scraper, monkeypatch):
+    FakeSession.delay = 0.01
+    sor = make_scraper(workers=4)
+
+    offenders = sor.parse_table(results_page(12))
+
+    assert [o['kno'] for o in offenders] == [str(i) for i in range(12)]
+    assert all(o['offenses'][0]['offense'] == '18-1508' for o in offenders)
+
+
+def test_failed_row_is_dropped(make_scraper, monkeypatch):
+    sor = make_scraper(workers=4)
+    build_offender = sor.build_offender
+
+    def flaky(row_data):
+        if row_data['kno'] == '3':
+            raise RuntimeError('boom')
+        return build_offender(row_data)
+
+    monkeypatch.setattr(sor, 'build_offender', flaky)
+
+    offenders = sor.parse_table(results_page(6))
+
+    assert [o['kno'] for o in offenders] == ['0', '1', '2', '4', '5']
+
+
+def test_rate_limit_is_shared_across_workers(make_scraper, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(scraper, 'time', clock)
+    sor = make_scraper(workers=8, request_delay=0.5)
+
+    sor.parse_table(results_page(10))
+
+    # Each request reads the clock twice under the rate lock: once to compute
+    # the wait, then once to record its start time
+    starts = clock.calls[1::2]
+    assert len(starts) == 20  # one image and one detail request per row
+    assert all(b - a >= 0.5 for a, b in zip(starts, starts[1:]))
+
+
+def test_executor_and_sessions_reused_across_pages(make_scraper):
+    sor = make_scraper(workers=3)
+
+    sor.parse_table(results_page(6))
+    executor = sor._executor
+    sor.parse_table(results_page(6))
+
+    assert sor._executor is executor
+    assert 1 <= len(FakeSession.instances) <= 3
+    assert all(len(session.threads) == 1 for session in FakeSession.instances)
+
+    sor.close()
+    assert sor._executor is None
+    assert all(session.closed for session in FakeSession.instances)
+
+
+def test_interrupt_cancels_queued_rows(make_scraper, monkeypatch):
+    FakeSession.delay = 0.02
+    sor = make_scraper(workers=2)
+    build_offender = sor.build_offender
+    processed = []
+
+    def interrupted(row_data):
+        if row_data['kno'] == '0':
+            raise KeyboardInterrupt
+        processed.append(row_data['kno'])
+        return build_offender(row_data)
+
+    monkeypatch.setattr(sor, 'build_offender', interrupted)
+
+    with pytest.raises(KeyboardInterrupt):
+        sor.parse_table(results_page(30))
+
+    time.sleep(0.2)
+    assert len(processed) < 5
+    assert sor._executor is None